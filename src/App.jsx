@@ -1,4 +1,4 @@
-import React, { useMemo, useState, useEffect, useCallback } from "react";
+import React, { useMemo, useState, useEffect, useCallback, lazy, Suspense } from "react";
 import { Card, CardContent } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
@@ -15,7 +15,6 @@ import {
   Sparkles, Globe, Zap, Shield, DollarSign, Wifi, WifiOff,
   MessageSquare, FileText, Languages, Video, Award, BookOpen, Filter, LogOut, User, Search
 } from "lucide-react";
-import { LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer, ReferenceLine } from "recharts";
 import {
   uid,
   createTimestamp,
@@ -28,11 +27,29 @@ import {
   getProgressStatus,
   computeStoreStats
 } from "@/lib/data";
+import { groupLogsByGoal } from "@/lib/analytics";
 import { usePersistentStore } from "@/hooks/usePersistentStore";
 import { AdvancedSearch } from "@/components/search/AdvancedSearch";
 import NotificationCenter from "@/components/notifications/NotificationCenter";
 import { triggerNotifications } from "@/lib/notificationManager";
 
+// Loaded on demand: recharts is only needed once a goal's detail dialog opens.
+// A failed chunk load (offline, stale cache after a deploy) degrades to a placeholder.
+const GoalTrendChart = lazy(() =>
+  import("@/components/analytics/GoalTrendChart").catch(error => {
+    console.warn("Goal chart failed to load:", error);
+    return { default: GoalChartUnavailable };
+  })
+);
+
+function GoalChartUnavailable() {
+  return (
+    <div className="h-[300px] flex items-center justify-center text-sm text-slate-500">
+      Chart unavailable. Reload the page to try again.
+    </div>
+  );
+}
+
 const usersStorageKey = "sumry_users_v1";
 const currentUserKey = "sumry_current_user";
 
@@ -408,7 +425,7 @@ function GoalDetailDialog({ goal, student, logs, onClose }) {
 
   const baseline = parseScore(goal.baseline);
   const target = parseScore(goal.target);
-  const trendline = calculateTrendline(sortedLogs);
+  const trendline = useMemo(() => calculateTrendline(sortedLogs), [sortedLogs]);
   const status = getProgressStatus(logs, goal.baseline, goal.target);
 
   const trendlineData = useMemo(() => {
@@ -488,25 +505,14 @@ function GoalDetailDialog({ goal, student, logs, onClose }) {
             <Card className="bg-white/80 backdrop-blur-xl border-black/5">
               <CardContent className="p-6">
                 <h4 className="text-sm font-semibold text-slate-900 mb-4">Progress Chart with Trend Analysis</h4>
-                <ResponsiveContainer width="100%" height={300}>
-                  <LineChart data={trendlineData}>
-                    <CartesianGrid strokeDasharray="3 3" stroke="#e2e8f0" />
-                    <XAxis dataKey="label" stroke="#64748b" style={{ fontSize: '12px' }} />
-                    <YAxis stroke="#64748b" style={{ fontSize: '12px' }} />
-                    <Tooltip
-                      contentStyle={{
-                        backgroundColor: 'white',
-                        border: '1px solid #e2e8f0',
-                        borderRadius: '8px',
-                        fontSize: '12px'
-                      }}
-                    />
-                    <Line type="monotone" dataKey="score" stroke="#3b82f6" strokeWidth={3} dot={{ r: 5, fill: '#3b82f6' }} name="Actual Score" />
-                    {trendline && <Line type="monotone" dataKey="trend" stroke="#94a3b8" strokeWidth={2} strokeDasharray="5 5" dot={false} name="Trend" />}
-                    {baseline !== null && <ReferenceLine y={baseline} stroke="#94a3b8" strokeDasharray="3 3" label={{ value: 'Baseline', position: 'left', style: { fontSize: '11px' } }} />}
-                    {target !== null && <ReferenceLine y={target} stroke="#22c55e" strokeDasharray="3 3" label={{ value: 'Target', position: 'left', style: { fontSize: '11px' } }} />}
-                  </LineChart>
-                </ResponsiveContainer>
+                <Suspense fallback={<div className="h-[300px]" />}>
+                  <GoalTrendChart
+                    data={trendlineData}
+                    showTrend={Boolean(trendline)}
+                    baseline={baseline}
+                    target={target}
+                  />
+                </Suspense>
               </CardContent>
             </Card>
           )}
@@ -574,6 +580,8 @@ function GoalsView({ store, setStore }) {
     return map;
   }, [store.students]);
 
+  const logsByGoal = useMemo(() => groupLogsByGoal(store.logs), [store.logs]);
+
   const filtered = useMemo(() => {
     const query = searchTerm.trim().toLowerCase();
     return store.goals.filter(g => {
@@ -597,6 +605,12 @@ function GoalsView({ store, setStore }) {
     [store.goals]
   );
 
+  // Stable logs array for the dialog's chart memos
+  const detailsLogs = useMemo(() =>
+    detailsDialog ? logsByGoal.get(detailsDialog.id) || [] : [],
+    [logsByGoal, detailsDialog]
+  );
+
   const handleSave = useCallback((goal) => {
     const now = createTimestamp();
     const goalWithTimestamps = {
@@ -675,8 +689,8 @@ function GoalsView({ store, setStore }) {
       ) : (
         <div className="space-y-3">
           {filtered.map(g => {
-            const logs = store.logs.filter(l => l.goalId === g.id);
-            const student = store.students.find(s => s.id === g.studentId);
+            const logs = logsByGoal.get(g.id) || [];
+            const studentName = studentLookup.get(g.studentId);
             const status = getProgressStatus(logs, g.baseline, g.target);
 
             return (
@@ -686,7 +700,7 @@ function GoalsView({ store, setStore }) {
                     <div className="flex-1">
                       <div className="flex items-center gap-2 mb-2 flex-wrap">
                         <Badge variant="outline" className="border-slate-200">{g.area}</Badge>
-                        <span className="text-sm font-medium text-slate-700">{student?.name}</span>
+                        <span className="text-sm font-medium text-slate-700">{studentName}</span>
                         <Badge
                           variant={status.color === 'green' ? 'default' : status.color === 'red' ? 'destructive' : 'secondary'}
                           className="ml-2"
@@ -733,7 +747,7 @@ function GoalsView({ store, setStore }) {
         <GoalDetailDialog
           goal={detailsDialog}
           student={store.students.find(s => s.id === detailsDialog.studentId)}
-          logs={store.logs.filter(l => l.goalId === detailsDialog.id)}
+          logs={detailsLogs}
           onClose={() => setDetailsDialog(null)}
         />
       )}
@@ -751,6 +765,7 @@ function ProgressView({ store, setStore }) {
   const filteredGoals = goalFilter === "all" ? store.goals : store.goals.filter(g => g.id === goalFilter);
   const goalLookup = useMemo(() => new Map(store.goals.map(goal => [goal.id, goal])), [store.goals]);
   const studentLookup = useMemo(() => new Map(store.students.map(student => [student.id, student])), [store.students]);
+  const logsByGoal = useMemo(() => groupLogsByGoal(store.logs), [store.logs]);
   const logsForExport = useMemo(() => goalFilter === "all" ? store.logs : store.logs.filter(log => log.goalId === goalFilter), [store.logs, goalFilter]);
 
   const exportLogsToCSV = useCallback(() => {
@@ -782,8 +797,8 @@ function ProgressView({ store, setStore }) {
     const trimmedScore = score.trim();
     if (goalFilter === "all" || !trimmedScore) return;
 
-    const goal = store.goals.find(g => g.id === goalFilter);
-    const student = goal ? store.students.find(s => s.id === goal.studentId) : null;
+    const goal = goalLookup.get(goalFilter);
+    const student = goal ? studentLookup.get(goal.studentId) : null;
 
     const newLog = {
       id: uid(),
@@ -837,7 +852,7 @@ function ProgressView({ store, setStore }) {
               <SelectContent>
                 <SelectItem value="all">All goals</SelectItem>
                 {store.goals.map(g => {
-                  const student = store.students.find(s => s.id === g.studentId);
+                  const student = studentLookup.get(g.studentId);
                   return (
                     <SelectItem key={g.id} value={g.id}>
                       {student?.name} - {g.area}: {g.description.slice(0, 50)}...
@@ -879,8 +894,8 @@ function ProgressView({ store, setStore }) {
 
       <div className="space-y-3">
         {filteredGoals.map(goal => {
-          const logs = store.logs.filter(l => l.goalId === goal.id);
-          const student = store.students.find(s => s.id === goal.studentId);
+          const logs = logsByGoal.get(goal.id) || [];
+          const student = studentLookup.get(goal.studentId);
 
           return (
             <Card key={goal.id} className="bg-white/80 backdrop-blur-xl border-black/5">
@@ -1110,9 +1125,12 @@ function Dashboard({ store, stats: statsOverride }) {
       const now = new Date();
       const DATA_GAP_THRESHOLD_DAYS = 14; // 2 weeks without data
 
+      const studentsById = new Map(store.students.map(student => [student.id, student]));
+      const logsByGoal = groupLogsByGoal(store.logs);
+
       store.goals.forEach(goal => {
-        const student = store.students.find(s => s.id === goal.studentId);
-        const logs = store.logs.filter(l => l.goalId === goal.id);
+        const student = studentsById.get(goal.studentId);
+        const logs = logsByGoal.get(goal.id) || [];
 
         if (logs.length === 0) return; // Skip goals with no logs yet
 
@@ -17,10 +17,7 @@ import {
   Filter
 } from 'lucide-react';
 import {
-  LineChart,
   Line,
-  BarChart,
-  Bar,
   AreaChart,
   Area,
   XAxis,
@@ -34,7 +31,8 @@ import {
   generateAnalyticsSummary,
   generateTimeSeriesData,
   calculateMovingAverage,
-  analyzeTrend
+  formatChartDate,
+  formatChartDateLong
 } from '@/lib/analytics';
 import ProgressChart from './ProgressChart';
 import GoalDistribution from './GoalDistribution';
@@ -75,11 +73,10 @@ export default function AnalyticsDashboard({ students = [], goals = [], logs = [
 
     const cutoffDate = new Date();
     cutoffDate.setDate(cutoffDate.getDate() - timeRange);
+    const cutoffTime = cutoffDate.getTime();
 
-    return logs.filter(log => {
-      const logDate = new Date(log.dateISO || log.date);
-      return logDate >= cutoffDate;
-    });
+    // Compare as millisecond timestamps
+    return logs.filter(log => Date.parse(log.dateISO || log.date) >= cutoffTime);
   }, [logs, timeRange]);
 
   // Calculate analytics summary
@@ -98,10 +95,12 @@ export default function AnalyticsDashboard({ students = [], goals = [], logs = [
 
     const avgScores = timeSeriesData.map(d => d.avgScore);
     const movingAvg = calculateMovingAverage(avgScores, 3);
+    // Moving averages by series index
+    const movingAvgByIndex = new Map(movingAvg.map(ma => [ma.index, ma.value]));
 
     return timeSeriesData.map((item, index) => ({
       ...item,
-      movingAvg: movingAvg.find(ma => ma.index === index)?.value || null
+      movingAvg: movingAvgByIndex.get(index) || null
     }));
   }, [timeSeriesData]);
 
@@ -323,7 +322,7 @@ export default function AnalyticsDashboard({ students = [], goals = [], logs = [
                       dataKey="date"
                       stroke="#6B7280"
                       fontSize={12}
-                      tickFormatter={(date) => new Date(date).toLocaleDateString('en-US', { month: 'short', day: 'numeric' })}
+                      tickFormatter={formatChartDate}
                     />
                     <YAxis stroke="#6B7280" fontSize={12} domain={[0, 100]} />
                     <Tooltip
@@ -333,12 +332,7 @@ export default function AnalyticsDashboard({ students = [], goals = [], logs = [
                         borderRadius: '8px',
                         boxShadow: '0 4px 6px rgba(0,0,0,0.1)'
                       }}
-                      labelFormatter={(date) => new Date(date).toLocaleDateString('en-US', {
-                        weekday: 'long',
-                        year: 'numeric',
-                        month: 'long',
-                        day: 'numeric'
-                      })}
+                      labelFormatter={formatChartDateLong}
                     />
                     <Legend />
                     <Area
@@ -29,8 +29,9 @@ import {
 import {
   calculateGoalAreaDistribution,
   calculateGoalStatusDistribution,
-  parseScore,
-  calculatePerformanceScore
+  calculatePerformanceScore,
+  groupLogsByGoal,
+  groupGoalsByStatus
 } from '@/lib/analytics';
 
 const AREA_COLORS = [
@@ -59,9 +60,17 @@ export default function GoalDistribution({ goals = [], logs = [] }) {
     return calculateGoalAreaDistribution(goals);
   }, [goals]);
 
+  const logsByGoal = useMemo(() => groupLogsByGoal(logs), [logs]);
+
+  // Classify each goal once; the chart and status cards both read from this
+  const goalsByStatus = useMemo(() => {
+    return groupGoalsByStatus(goals, logsByGoal);
+  }, [goals, logsByGoal]);
+
   const statusDistribution = useMemo(() => {
-    return calculateGoalStatusDistribution(goals, logs);
-  }, [goals, logs]);
+    // Counts come from goalsByStatus, so logs are not needed here
+    return calculateGoalStatusDistribution(goals, undefined, goalsByStatus);
+  }, [goals, goalsByStatus]);
 
   // Get detailed goals for selected area
   const selectedAreaGoals = useMemo(() => {
@@ -69,11 +78,11 @@ export default function GoalDistribution({ goals = [], logs = [] }) {
     return goals
       .filter(g => (g.area || 'General') === selectedArea)
       .map(goal => {
-        const goalLogs = logs.filter(l => l.goalId === goal.id);
+        const goalLogs = logsByGoal.get(goal.id) || [];
         const performance = calculatePerformanceScore(goalLogs, goal.baseline, goal.target);
         return { ...goal, performance, logsCount: goalLogs.length };
       });
-  }, [goals, logs, selectedArea]);
+  }, [goals, logsByGoal, selectedArea]);
 
   // Drill down into area
   const handleAreaClick = (data) => {
@@ -297,25 +306,11 @@ export default function GoalDistribution({ goals = [], logs = [] }) {
           {/* Status Cards */}
           <div className="mt-6 space-y-3">
             {statusDistribution.map((status) => {
-              const statusGoals = goals.filter(goal => {
-                const goalLogs = logs.filter(l => l.goalId === goal.id);
-                const scores = goalLogs.map(log => parseScore(log.score)).filter(s => s !== null);
-
-                if (scores.length < 3) return status.status === 'Needs Data';
-
-                const performance = calculatePerformanceScore(goalLogs, goal.baseline, goal.target);
-                if (!performance) return status.status === 'Needs Data';
-
-                if (performance.progress >= 100) return status.status === 'Completed';
-                if (performance.progress >= 80) return status.status === 'On Track';
-                return status.status === 'Off Track';
-              });
-
               return (
                 <StatusCard
                   key={status.status}
                   status={status}
-                  goals={statusGoals}
+                  goals={goalsByStatus[status.key]}
                   isExpanded={expandedStatus === status.status}
                   onToggle={() => toggleStatusDetails(status.status)}
                 />
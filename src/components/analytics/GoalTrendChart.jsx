@@ -0,0 +1,47 @@
+import { useMemo } from 'react';
+import {
+  LineChart,
+  Line,
+  XAxis,
+  YAxis,
+  CartesianGrid,
+  Tooltip,
+  ResponsiveContainer,
+  ReferenceLine
+} from 'recharts';
+import { downsampleLTTB, DENSE_CHART_POINTS } from '@/lib/analytics';
+
+// Longer histories are downsampled to this many points
+const MAX_CHART_POINTS = 500;
+
+/**
+ * Goal Trend Chart Component
+ * Single-goal score line with optional trendline and baseline/target references.
+ * Lazy-loaded by the goal detail dialog.
+ */
+export default function GoalTrendChart({ data, showTrend, baseline, target }) {
+  const points = useMemo(() => downsampleLTTB(data, MAX_CHART_POINTS, d => d.score), [data]);
+  const isDense = points.length > DENSE_CHART_POINTS;
+
+  return (
+    <ResponsiveContainer width="100%" height={300}>
+      <LineChart data={points}>
+        <CartesianGrid strokeDasharray="3 3" stroke="#e2e8f0" />
+        <XAxis dataKey="label" stroke="#64748b" style={{ fontSize: '12px' }} />
+        <YAxis stroke="#64748b" style={{ fontSize: '12px' }} />
+        <Tooltip
+          contentStyle={{
+            backgroundColor: 'white',
+            border: '1px solid #e2e8f0',
+            borderRadius: '8px',
+            fontSize: '12px'
+          }}
+        />
+        <Line type="monotone" dataKey="score" stroke="#3b82f6" strokeWidth={3} dot={isDense ? false : { r: 5, fill: '#3b82f6' }} isAnimationActive={!isDense} name="Actual Score" />
+        {showTrend && <Line type="monotone" dataKey="trend" stroke="#94a3b8" strokeWidth={2} strokeDasharray="5 5" dot={false} isAnimationActive={!isDense} name="Trend" />}
+        {baseline !== null && <ReferenceLine y={baseline} stroke="#94a3b8" strokeDasharray="3 3" label={{ value: 'Baseline', position: 'left', style: { fontSize: '11px' } }} />}
+        {target !== null && <ReferenceLine y={target} stroke="#22c55e" strokeDasharray="3 3" label={{ value: 'Target', position: 'left', style: { fontSize: '11px' } }} />}
+      </LineChart>
+    </ResponsiveContainer>
+  );
+}
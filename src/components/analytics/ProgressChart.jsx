@@ -13,7 +13,6 @@ import {
   ResponsiveContainer,
   Legend,
   ReferenceLine,
-  ReferenceArea,
   Scatter,
   ScatterChart,
   ZAxis
@@ -33,8 +32,12 @@ import {
   predictFutureValues,
   analyzeTrend,
   detectAnomalies,
-  parseScore
+  groupLogsByGoal,
+  formatChartDate,
+  formatChartDateLong,
+  DENSE_CHART_POINTS
 } from '@/lib/analytics';
+import { parseScore } from '@/lib/data';
 
 const COLORS = {
   primary: '#65A39B',
@@ -70,6 +73,22 @@ export default function ProgressChart({ goals = [], logs = [], students = [] })
     return prepareChartData(goalsToShow, logs, students);
   }, [goals, logs, students, selectedGoals]);
 
+  // Goal card data: student, trend and log count for every goal
+  const goalSummaries = useMemo(() => {
+    const studentsById = new Map(students.map(student => [student.id, student]));
+    const logsByGoal = groupLogsByGoal(logs);
+
+    return goals.map(goal => {
+      const goalLogs = logsByGoal.get(goal.id) || [];
+      return {
+        goal,
+        student: studentsById.get(goal.studentId),
+        trend: analyzeTrend(goalLogs.map(l => parseScore(l.score)).filter(s => s !== null)),
+        logsCount: goalLogs.length
+      };
+    });
+  }, [goals, logs, students]);
+
   // Toggle goal selection
   const toggleGoal = (goalId) => {
     setSelectedGoals(prev =>
@@ -79,6 +98,8 @@ export default function ProgressChart({ goals = [], logs = [], students = [] })
     );
   };
 
+  const isDenseChart = chartData.timelineData.length > DENSE_CHART_POINTS;
+
   // Zoom controls
   const handleZoomIn = () => setZoomLevel(prev => Math.min(prev + 0.2, 2));
   const handleZoomOut = () => setZoomLevel(prev => Math.max(prev - 0.2, 0.5));
@@ -166,12 +187,7 @@ export default function ProgressChart({ goals = [], logs = [], students = [] })
                     dataKey="date"
                     stroke="#6B7280"
                     fontSize={12}
-                    tickFormatter={(date) =>
-                      new Date(date).toLocaleDateString('en-US', {
-                        month: 'short',
-                        day: 'numeric'
-                      })
-                    }
+                    tickFormatter={formatChartDate}
                   />
                   <YAxis
                     stroke="#6B7280"
@@ -212,7 +228,7 @@ export default function ProgressChart({ goals = [], logs = [], students = [] })
                       name={series.name}
                       stroke={series.color}
                       strokeWidth={3}
-                      dot={{
+                      dot={isDenseChart ? false : {
                         r: 4,
                         strokeWidth: 2,
                         fill: 'white',
@@ -223,6 +239,7 @@ export default function ProgressChart({ goals = [], logs = [], students = [] })
                         onMouseEnter: (e, payload) => setHoveredPoint(payload)
                       }}
                       connectNulls
+                      isAnimationActive={!isDenseChart}
                       animationDuration={1000}
                     />
                   ))}
@@ -240,6 +257,7 @@ export default function ProgressChart({ goals = [], logs = [], students = [] })
                         dot={false}
                         name={`${series.name} Trend`}
                         strokeOpacity={0.5}
+                        isAnimationActive={!isDenseChart}
                         animationDuration={1000}
                       />
                     )
@@ -279,12 +297,7 @@ export default function ProgressChart({ goals = [], logs = [], students = [] })
                         dataKey="date"
                         stroke="#6B7280"
                         fontSize={12}
-                        tickFormatter={(date) =>
-                          new Date(date).toLocaleDateString('en-US', {
-                            month: 'short',
-                            day: 'numeric'
-                          })
-                        }
+                        tickFormatter={formatChartDate}
                       />
                       <YAxis stroke="#6B7280" fontSize={12} />
                       <ZAxis range={[50, 200]} />
@@ -320,23 +333,17 @@ export default function ProgressChart({ goals = [], logs = [], students = [] })
         </CardHeader>
         <CardContent>
           <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-3">
-            {goals.map((goal) => {
-              const student = students.find(s => s.id === goal.studentId);
-              const goalLogs = logs.filter(l => l.goalId === goal.id);
-              const trend = analyzeTrend(goalLogs.map(l => parseScore(l.score)).filter(s => s !== null));
-
-              return (
-                <GoalCard
-                  key={goal.id}
-                  goal={goal}
-                  student={student}
-                  trend={trend}
-                  logsCount={goalLogs.length}
-                  isSelected={selectedGoals.includes(goal.id)}
-                  onToggle={() => toggleGoal(goal.id)}
-                />
-              );
-            })}
+            {goalSummaries.map(({ goal, student, trend, logsCount }) => (
+              <GoalCard
+                key={goal.id}
+                goal={goal}
+                student={student}
+                trend={trend}
+                logsCount={logsCount}
+                isSelected={selectedGoals.includes(goal.id)}
+                onToggle={() => toggleGoal(goal.id)}
+              />
+            ))}
           </div>
         </CardContent>
       </Card>
@@ -375,14 +382,17 @@ function prepareChartData(goals, logs, students) {
     '#3B82F6'
   ];
 
+  const studentsById = new Map(students.map(student => [student.id, student]));
+  const logsByGoal = groupLogsByGoal(logs);
+
   goals.forEach((goal, index) => {
-    const goalLogs = logs
-      .filter(l => l.goalId === goal.id)
+    // Groups are local to this call, so they can be sorted in place
+    const goalLogs = (logsByGoal.get(goal.id) || [])
       .sort((a, b) => new Date(a.dateISO) - new Date(b.dateISO));
 
     if (goalLogs.length === 0) return;
 
-    const student = students.find(s => s.id === goal.studentId);
+    const student = studentsById.get(goal.studentId);
     const color = goalColors[index % goalColors.length];
     const key = `goal_${goal.id}`;
     const trendKey = `trend_${goal.id}`;
@@ -391,11 +401,11 @@ function prepareChartData(goals, logs, students) {
     // Extract scores
     const scores = goalLogs.map(log => parseScore(log.score)).filter(s => s !== null);
 
-    // Calculate trendline
+    // Calculate trendline once and reuse it for predictions and trend analysis
     const trendline = calculateTrendline(scores);
 
     // Calculate predictions
-    const predictions = predictFutureValues(scores, 3);
+    const predictions = predictFutureValues(scores, 3, trendline);
 
     // Detect anomalies
     const goalAnomalies = detectAnomalies(goalLogs);
@@ -410,7 +420,7 @@ function prepareChartData(goals, logs, students) {
     });
 
     // Analyze trend
-    const trend = analyzeTrend(scores);
+    const trend = analyzeTrend(scores, trendline);
 
     // Add insight
     insights.push({
@@ -422,14 +432,21 @@ function prepareChartData(goals, logs, students) {
       color
     });
 
-    // Add dates to set
-    goalLogs.forEach(log => allDates.add(log.dateISO));
+    // Add dates to set and index the first log on each date for timeline lookups
+    const dateIndex = new Map();
+    goalLogs.forEach((log, logIndex) => {
+      allDates.add(log.dateISO);
+      if (!dateIndex.has(log.dateISO)) {
+        dateIndex.set(log.dateISO, logIndex);
+      }
+    });
+
+    const lastLogDate = new Date(goalLogs[goalLogs.length - 1].dateISO);
 
     // Add prediction dates
     if (predictions.length > 0) {
-      const lastDate = new Date(goalLogs[goalLogs.length - 1].dateISO);
       predictions.forEach((pred, i) => {
-        const futureDate = new Date(lastDate);
+        const futureDate = new Date(lastLogDate);
         futureDate.setDate(futureDate.getDate() + (i + 1) * 7);
         allDates.add(futureDate.toISOString().split('T')[0]);
       });
@@ -444,6 +461,8 @@ function prepareChartData(goals, logs, students) {
       target: parseScore(goal.target),
       baseline: parseScore(goal.baseline),
       logs: goalLogs,
+      dateIndex,
+      lastLogDate,
       trendData: trendline,
       predictions,
       trend
@@ -456,24 +475,20 @@ function prepareChartData(goals, logs, students) {
     const dataPoint = { date };
 
     series.forEach(s => {
+      const logIndex = s.dateIndex.get(date);
+
       // Actual data
-      const log = s.logs.find(l => l.dateISO === date);
-      dataPoint[s.key] = log ? parseScore(log.score) : null;
+      dataPoint[s.key] = logIndex !== undefined ? parseScore(s.logs[logIndex].score) : null;
 
       // Trendline data
-      if (s.trendData) {
-        const logIndex = s.logs.findIndex(l => l.dateISO === date);
-        if (logIndex >= 0) {
-          dataPoint[s.trendKey] = s.trendData.slope * logIndex + s.trendData.intercept;
-        }
+      if (s.trendData && logIndex !== undefined) {
+        dataPoint[s.trendKey] = s.trendData.slope * logIndex + s.trendData.intercept;
       }
 
       // Prediction data
       if (s.predictions && s.predictions.length > 0) {
-        const lastLogDate = s.logs[s.logs.length - 1].dateISO;
-        const lastDate = new Date(lastLogDate);
         const currentDate = new Date(date);
-        const daysDiff = Math.floor((currentDate - lastDate) / (1000 * 60 * 60 * 24));
+        const daysDiff = Math.floor((currentDate - s.lastLogDate) / (1000 * 60 * 60 * 24));
 
         if (daysDiff > 0 && daysDiff <= s.predictions.length * 7) {
           const predIndex = Math.floor(daysDiff / 7);
@@ -548,12 +563,7 @@ function CustomTooltip({ active, payload, label, hoveredPoint }) {
   return (
     <div className="bg-white border-2 border-gray-200 rounded-lg shadow-lg p-3 max-w-xs">
       <p className="font-semibold text-sm mb-2">
-        {new Date(label).toLocaleDateString('en-US', {
-          weekday: 'long',
-          year: 'numeric',
-          month: 'long',
-          day: 'numeric'
-        })}
+        {formatChartDateLong(label)}
       </p>
       <div className="space-y-1">
         {payload.map((entry, index) => (
@@ -11,12 +11,7 @@ import {
   PolarRadiusAxis,
   ResponsiveContainer,
   Legend,
-  Tooltip,
-  BarChart,
-  Bar,
-  XAxis,
-  YAxis,
-  CartesianGrid
+  Tooltip
 } from 'recharts';
 import {
   Users,
@@ -30,8 +25,7 @@ import {
 } from 'lucide-react';
 import {
   calculateStudentComparisons,
-  calculateMean,
-  parseScore
+  calculateMean
 } from '@/lib/analytics';
 
 const STUDENT_COLORS = [
@@ -45,6 +39,16 @@ const STUDENT_COLORS = [
   '#F97316'
 ];
 
+// Sort rank for trend directions; unknown directions rank lowest
+const TREND_ORDER = { improving: 3, stable: 2, declining: 1 };
+
+const getHeatmapColor = (value) => {
+  if (value >= 80) return 'bg-green-500';
+  if (value >= 60) return 'bg-yellow-500';
+  if (value >= 40) return 'bg-orange-500';
+  return 'bg-red-500';
+};
+
 /**
  * Student Performance Component
  * Multi-student comparison with radar charts, heatmaps, and sortable tables
@@ -57,9 +61,13 @@ export default function StudentPerformance({ students = [], goals = [], logs = [
   const [disabilityFilter, setDisabilityFilter] = useState(null);
   const [viewMode, setViewMode] = useState('radar');
 
-  // Calculate student comparisons
+  const allComparisons = useMemo(() => {
+    return calculateStudentComparisons(students, goals, logs);
+  }, [students, goals, logs]);
+
+  // Filter and sort a copy of allComparisons
   const studentComparisons = useMemo(() => {
-    let comparisons = calculateStudentComparisons(students, goals, logs);
+    let comparisons = [...allComparisons];
 
     // Apply filters
     if (gradeFilter) {
@@ -75,9 +83,8 @@ export default function StudentPerformance({ students = [], goals = [], logs = [
       let bVal = b[sortBy];
 
       if (sortBy === 'trend') {
-        const trendOrder = { improving: 3, stable: 2, declining: 1 };
-        aVal = trendOrder[a.trend.direction] || 0;
-        bVal = trendOrder[b.trend.direction] || 0;
+        aVal = TREND_ORDER[a.trend.direction] || 0;
+        bVal = TREND_ORDER[b.trend.direction] || 0;
       }
 
       if (sortOrder === 'asc') {
@@ -87,7 +94,7 @@ export default function StudentPerformance({ students = [], goals = [], logs = [
     });
 
     return comparisons;
-  }, [students, goals, logs, sortBy, sortOrder, gradeFilter, disabilityFilter]);
+  }, [allComparisons, sortBy, sortOrder, gradeFilter, disabilityFilter]);
 
   // Get unique grades and disabilities for filters
   const uniqueGrades = useMemo(() => {
@@ -124,17 +131,23 @@ export default function StudentPerformance({ students = [], goals = [], logs = [
     });
   }, [studentComparisons, selectedStudents]);
 
-  // Prepare heatmap data
+  // Prepare heatmap data with each cell's color, opacity and label resolved
   const heatmapData = useMemo(() => {
     return studentComparisons.map(student => {
       const skills = Object.keys(student.skillAverages);
       return {
         name: student.name,
         id: student.id,
-        skills: skills.map(skill => ({
-          skill,
-          value: student.skillAverages[skill]
-        }))
+        skills: skills.map(skill => {
+          const value = student.skillAverages[skill];
+          return {
+            skill,
+            value,
+            colorClass: getHeatmapColor(value),
+            style: { opacity: Math.max(0.2, value / 100) },
+            label: value.toFixed(0)
+          };
+        })
       };
     });
   }, [studentComparisons]);
@@ -379,17 +392,6 @@ function RadarView({ radarData, selectedStudents, studentComparisons }) {
 }
 
 function HeatmapView({ heatmapData }) {
-  const getHeatmapColor = (value) => {
-    if (value >= 80) return 'bg-green-500';
-    if (value >= 60) return 'bg-yellow-500';
-    if (value >= 40) return 'bg-orange-500';
-    return 'bg-red-500';
-  };
-
-  const getHeatmapOpacity = (value) => {
-    return Math.max(0.2, value / 100);
-  };
-
   return (
     <Card>
       <CardHeader>
@@ -402,20 +404,18 @@ function HeatmapView({ heatmapData }) {
               <div key={student.id} className="mb-4">
                 <div className="font-semibold text-sm mb-2">{student.name}</div>
                 <div className="flex gap-2 flex-wrap">
+                  {/* Plain CSS hover effect */}
                   {student.skills.map((skill) => (
-                    <motion.div
+                    <div
                       key={skill.skill}
-                      className="relative group"
-                      whileHover={{ scale: 1.1 }}
+                      className="relative group transition-transform hover:scale-110"
                     >
                       <div
-                        className={`w-16 h-16 rounded-lg flex items-center justify-center ${getHeatmapColor(
-                          skill.value
-                        )} transition-all`}
-                        style={{ opacity: getHeatmapOpacity(skill.value) }}
+                        className={`w-16 h-16 rounded-lg flex items-center justify-center ${skill.colorClass} transition-all`}
+                        style={skill.style}
                       >
                         <span className="text-white font-bold text-sm">
-                          {skill.value.toFixed(0)}
+                          {skill.label}
                         </span>
                       </div>
                       <div className="absolute bottom-full left-1/2 transform -translate-x-1/2 mb-2 hidden group-hover:block">
@@ -426,7 +426,7 @@ function HeatmapView({ heatmapData }) {
                       <div className="text-xs text-center mt-1 text-gray-600 truncate w-16">
                         {skill.skill}
                       </div>
-                    </motion.div>
+                    </div>
                   ))}
                 </div>
               </div>
@@ -1,4 +1,4 @@
-import { useState } from 'react';
+import { useState, useMemo } from 'react';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
 import { Tabs, TabsContent, TabsList, TabsTrigger } from '@/components/ui/tabs';
@@ -13,17 +13,22 @@ import { generateInsights, generateInsightsSummary, getInsightStats } from '@/li
  */
 export default function InsightsDemoPage() {
   const [showCode, setShowCode] = useState(false);
-  const demoData = loadDemoData();
+  // Sample data, generated once per mount
+  const [demoData] = useState(loadDemoData);
 
-  const insights = generateInsights(
-    demoData.students,
-    demoData.goals,
-    demoData.logs,
-    demoData.accommodations
-  );
-
-  const summary = generateInsightsSummary(insights);
-  const stats = getInsightStats(insights);
+  const { insights, summary, stats } = useMemo(() => {
+    const demoInsights = generateInsights(
+      demoData.students,
+      demoData.goals,
+      demoData.logs,
+      demoData.accommodations
+    );
+    return {
+      insights: demoInsights,
+      summary: generateInsightsSummary(demoInsights),
+      stats: getInsightStats(demoInsights)
+    };
+  }, [demoData]);
 
   const handleExportData = () => {
     const blob = new Blob([JSON.stringify(demoData, null, 2)], {
@@ -1,4 +1,4 @@
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useMemo } from 'react';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
 import { Tabs, TabsContent, TabsList, TabsTrigger } from '@/components/ui/tabs';
@@ -169,8 +169,10 @@ export default function InsightsDashboard() {
 }
 
 function OverviewStats({ students, goals, logs }) {
-  const insights = generateInsights(students, goals, logs);
-  const stats = getInsightStats(insights);
+  const stats = useMemo(
+    () => getInsightStats(generateInsights(students, goals, logs)),
+    [students, goals, logs]
+  );
 
   return (
     <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4">
@@ -244,21 +246,26 @@ function OverviewStats({ students, goals, logs }) {
 }
 
 function StudentBreakdown({ students, goals, logs, accommodations }) {
-  return (
-    <div className="space-y-4">
-      {students.map(student => {
-        const studentGoals = goals.filter(g => g.studentId === student.id);
-        const studentLogs = logs.filter(l =>
-          studentGoals.some(g => g.id === l.goalId)
-        );
+  const breakdown = useMemo(() => {
+    return students.map(student => {
+      const studentGoals = goals.filter(g => g.studentId === student.id);
+      const studentGoalIds = new Set(studentGoals.map(g => g.id));
+      const studentLogs = logs.filter(l => studentGoalIds.has(l.goalId));
 
-        const insights = generateInsights(
-          [student],
-          studentGoals,
-          studentLogs,
-          accommodations
-        );
+      const insights = generateInsights(
+        [student],
+        studentGoals,
+        studentLogs,
+        accommodations
+      );
+
+      return { student, studentGoals, studentLogs, insights };
+    });
+  }, [students, goals, logs, accommodations]);
 
+  return (
+    <div className="space-y-4">
+      {breakdown.map(({ student, studentGoals, studentLogs, insights }) => {
         return (
           <Card key={student.id}>
             <CardHeader>
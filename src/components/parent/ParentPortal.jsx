@@ -8,6 +8,7 @@ import {
   Download, Share2, Bell, Eye, CheckCircle, Target, Sparkles
 } from 'lucide-react';
 import { LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer } from 'recharts';
+import { selectTopN } from '@/lib/analytics';
 
 /**
  * Parent Portal - Family engagement and transparency
@@ -18,10 +19,13 @@ export default function ParentPortal({ student, goals, progressLogs }) {
   const [messages, setMessages] = useState([]);
 
   const studentGoals = goals.filter(g => g.studentId === student.id);
-  const recentProgress = progressLogs
-    .filter(log => studentGoals.some(g => g.id === log.goalId))
-    .sort((a, b) => new Date(b.dateISO) - new Date(a.dateISO))
-    .slice(0, 10);
+  const studentGoalIds = new Set(studentGoals.map(g => g.id));
+  // 10 most recent logs, newest first
+  const recentProgress = selectTopN(
+    progressLogs.filter(log => studentGoalIds.has(log.goalId)),
+    10,
+    (a, b) => new Date(b.dateISO) - new Date(a.dateISO)
+  );
 
   return (
     <div className="min-h-screen bg-gradient-to-br from-sky-100 via-blue-50 to-indigo-100 p-6">
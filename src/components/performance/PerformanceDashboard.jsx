@@ -58,6 +58,19 @@ import {
   getPerformanceBudgets
 } from '@/lib/performanceMonitor';
 
+// Score bands, highest first; the score display and rating badge both read from this table
+const SCORE_BANDS = [
+  { min: 90, label: 'Excellent', textClass: 'text-green-600', badgeClass: 'bg-green-100 text-green-800' },
+  { min: 70, label: 'Good', textClass: 'text-yellow-600', badgeClass: 'bg-yellow-100 text-yellow-800' },
+  { min: 50, label: 'Fair', textClass: 'text-orange-600', badgeClass: 'bg-orange-100 text-orange-800' },
+  { min: 0, label: 'Needs Improvement', textClass: 'text-red-600', badgeClass: 'bg-red-100 text-red-800' }
+];
+
+const getScoreBand = (score) => {
+  if (score === null) return null;
+  return SCORE_BANDS.find(band => score >= band.min) ?? SCORE_BANDS[SCORE_BANDS.length - 1];
+};
+
 /**
  * Performance Dashboard Component
  * Real-time monitoring and visualization of application performance metrics
@@ -178,15 +191,6 @@ export default function PerformanceDashboard() {
     updateMetrics();
   };
 
-  // Get performance score color
-  const getScoreColor = (score) => {
-    if (score === null) return 'gray';
-    if (score >= 90) return 'green';
-    if (score >= 70) return 'yellow';
-    if (score >= 50) return 'orange';
-    return 'red';
-  };
-
   // Get rating badge
   const getRatingBadge = (rating) => {
     const variants = {
@@ -229,6 +233,8 @@ export default function PerformanceDashboard() {
     );
   }
 
+  const scoreBand = getScoreBand(performanceScore);
+
   return (
     <div className="space-y-6 pb-8">
       {/* Header */}
@@ -352,28 +358,14 @@ export default function PerformanceDashboard() {
                     key={performanceScore}
                     initial={{ scale: 1.2, opacity: 0 }}
                     animate={{ scale: 1, opacity: 1 }}
-                    className={`text-6xl font-bold ${
-                      getScoreColor(performanceScore) === 'green' ? 'text-green-600' :
-                      getScoreColor(performanceScore) === 'yellow' ? 'text-yellow-600' :
-                      getScoreColor(performanceScore) === 'orange' ? 'text-orange-600' :
-                      getScoreColor(performanceScore) === 'red' ? 'text-red-600' :
-                      'text-gray-400'
-                    }`}
+                    className={`text-6xl font-bold ${scoreBand?.textClass ?? 'text-gray-400'}`}
                   >
                     {performanceScore !== null ? performanceScore : '--'}
                   </motion.div>
                   <div className="text-sm text-gray-500 mt-1">out of 100</div>
-                  {performanceScore !== null && (
-                    <Badge className={`mt-2 ${
-                      performanceScore >= 90 ? 'bg-green-100 text-green-800' :
-                      performanceScore >= 70 ? 'bg-yellow-100 text-yellow-800' :
-                      performanceScore >= 50 ? 'bg-orange-100 text-orange-800' :
-                      'bg-red-100 text-red-800'
-                    }`}>
-                      {performanceScore >= 90 ? 'Excellent' :
-                       performanceScore >= 70 ? 'Good' :
-                       performanceScore >= 50 ? 'Fair' :
-                       'Needs Improvement'}
+                  {scoreBand && (
+                    <Badge className={`mt-2 ${scoreBand.badgeClass}`}>
+                      {scoreBand.label}
                     </Badge>
                   )}
                 </div>
@@ -0,0 +1,50 @@
+/**
+ * Persistent Store Hook Tests
+ *
+ * @module usePersistentStore.test
+ */
+
+import { describe, it, expect, beforeEach, vi } from 'vitest';
+import { renderHook, act } from '@testing-library/react';
+import { saveStore } from '@/lib/data';
+import { usePersistentStore } from '../usePersistentStore';
+
+vi.mock('@/lib/data', async (importOriginal) => {
+  const actual = await importOriginal();
+  return { ...actual, saveStore: vi.fn() };
+});
+
+describe('usePersistentStore', () => {
+  beforeEach(() => {
+    saveStore.mockClear();
+  });
+
+  it('keeps the same store when an update has identical content', () => {
+    const { result } = renderHook(() => usePersistentStore());
+    const initial = result.current.store;
+
+    act(() => {
+      result.current.setStore(prev => ({ ...prev, students: [...prev.students] }));
+    });
+
+    expect(result.current.store).toBe(initial);
+    expect(saveStore).not.toHaveBeenCalled();
+  });
+
+  it('saves the store when an update changes its content', () => {
+    const { result } = renderHook(() => usePersistentStore());
+    const initial = result.current.store;
+
+    act(() => {
+      result.current.setStore(prev => ({
+        ...prev,
+        students: [...prev.students, { id: 's1', name: 'Ada' }]
+      }));
+    });
+
+    expect(result.current.store).not.toBe(initial);
+    expect(result.current.store.students.map(s => s.name)).toEqual(['Ada']);
+    expect(saveStore).toHaveBeenCalledTimes(1);
+    expect(saveStore).toHaveBeenCalledWith(result.current.store);
+  });
+});
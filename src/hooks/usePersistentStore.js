@@ -1,17 +1,38 @@
 import { useCallback, useEffect, useRef, useState } from "react";
 import { loadStore, normalizeStoreData, saveStore, storageKey } from "@/lib/data";
 
+// Serialized JSON per store snapshot; valid because snapshots are never mutated (see usePersistentStore)
+const serializedStores = new WeakMap();
+
 function serializeStore(store) {
+  if (store && typeof store === "object" && serializedStores.has(store)) {
+    return serializedStores.get(store);
+  }
+  let serialized;
   try {
-    return JSON.stringify(store);
+    serialized = JSON.stringify(store);
   } catch {
-    return "";
+    serialized = "";
   }
+  if (store && typeof store === "object") {
+    serializedStores.set(store, serialized);
+  }
+  return serialized;
 }
 
+/**
+ * Store state persisted to localStorage and synced across tabs
+ * Snapshots are immutable: updaters must return new objects rather than mutate the previous
+ * store, or its cached serialization goes stale and change detection compares outdated JSON
+ */
 export function usePersistentStore() {
-  const [store, rawSetStore] = useState(() => normalizeStoreData(loadStore()));
-  const lastSerializedRef = useRef(serializeStore(store));
+  // loadStore() returns a normalized store
+  const [store, rawSetStore] = useState(loadStore);
+  // Serialized lazily, on the first render only
+  const lastSerializedRef = useRef(null);
+  if (lastSerializedRef.current === null) {
+    lastSerializedRef.current = serializeStore(store);
+  }
 
   useEffect(() => {
     const serialized = serializeStore(store);
@@ -25,7 +46,7 @@ export function usePersistentStore() {
 
     const handleStorage = (event) => {
       if (event.key !== storageKey) return;
-      const next = normalizeStoreData(loadStore());
+      const next = loadStore();
       const serialized = serializeStore(next);
       if (serialized === lastSerializedRef.current) return;
       lastSerializedRef.current = serialized;
@@ -0,0 +1,225 @@
+/**
+ * SUMRY Analytics Engine Tests
+ *
+ * @module analytics.test
+ */
+
+import { describe, it, expect } from 'vitest';
+import {
+  formatChartDate,
+  formatChartDateLong,
+  calculateStudentComparisons,
+  calculateTrendline,
+  selectTopN,
+  downsampleLTTB,
+  groupLogsByGoal,
+  getGoalStatus,
+  generateTimeSeriesData,
+  groupGoalsByStatus,
+  calculateGoalStatusDistribution
+} from '../analytics';
+
+const students = [
+  { id: 's1', name: 'Alice', grade: '3', disability: 'SLD' },
+  { id: 's2', name: 'Bob', grade: '4', disability: 'ADHD' },
+  { id: 's3', name: 'Cara', grade: '4', disability: 'OHI' }
+];
+
+const goals = [
+  { id: 'g1', studentId: 's1', area: 'Reading', baseline: '40', target: '90' },
+  { id: 'g2', studentId: 's1', area: 'Math', baseline: '30', target: '80' },
+  { id: 'g3', studentId: 's2', area: 'Reading', baseline: '50', target: '90' },
+  { id: 'g4', studentId: 's3', area: '', baseline: '50', target: '90' }
+];
+
+const logs = [
+  { id: 'l1', goalId: 'g1', dateISO: '2024-01-01', score: '50' },
+  { id: 'l2', goalId: 'g2', dateISO: '2024-01-02', score: '40' },
+  { id: 'l3', goalId: 'g1', dateISO: '2024-01-08', score: '60' },
+  { id: 'l4', goalId: 'g3', dateISO: '2024-01-03', score: '70' },
+  { id: 'l5', goalId: 'g3', dateISO: '2024-01-10', score: 'absent' },
+  { id: 'l6', goalId: 'g2', dateISO: '2024-01-09', score: '60' },
+  { id: 'l7', goalId: 'missing', dateISO: '2024-01-09', score: '99' }
+];
+
+describe('formatChartDate', () => {
+  it('formats axis and tooltip dates', () => {
+    const date = new Date(2024, 0, 5);
+    expect(formatChartDate(date)).toBe('Jan 5');
+    expect(formatChartDateLong(date)).toBe('Friday, January 5, 2024');
+  });
+
+  it('returns Invalid Date for unparseable input, like toLocaleDateString', () => {
+    expect(formatChartDate('garbage')).toBe('Invalid Date');
+    expect(formatChartDateLong('garbage')).toBe('Invalid Date');
+  });
+});
+
+describe('calculateStudentComparisons', () => {
+  it('aggregates scores per student in log order', () => {
+    const comparisons = calculateStudentComparisons(students, goals, logs);
+    const alice = comparisons.find(c => c.id === 's1');
+
+    expect(alice.totalGoals).toBe(2);
+    expect(alice.dataPoints).toBe(4);
+    expect(alice.avgScore).toBe(52.5);
+    expect(alice.medianScore).toBe(55);
+    expect(alice.skillAverages).toEqual({ Reading: 55, Math: 50 });
+  });
+
+  it('ignores unparseable scores and logs for unknown goals', () => {
+    const comparisons = calculateStudentComparisons(students, goals, logs);
+    const bob = comparisons.find(c => c.id === 's2');
+
+    expect(bob.dataPoints).toBe(1);
+    expect(bob.avgScore).toBe(70);
+  });
+
+  it('keeps skill areas for goals without data', () => {
+    const comparisons = calculateStudentComparisons(students, goals, logs);
+    const cara = comparisons.find(c => c.id === 's3');
+
+    expect(cara.totalGoals).toBe(1);
+    expect(cara.dataPoints).toBe(0);
+    expect(cara.skillAverages).toEqual({ General: 0 });
+  });
+
+  it('sorts students by average score', () => {
+    const comparisons = calculateStudentComparisons(students, goals, logs);
+    expect(comparisons.map(c => c.id)).toEqual(['s2', 's1', 's3']);
+  });
+});
+
+describe('calculateTrendline', () => {
+  it('fits a perfect line with an R-squared of 1', () => {
+    const trendline = calculateTrendline([10, 20, 30, 40]);
+
+    expect(trendline.slope).toBe(10);
+    expect(trendline.intercept).toBe(10);
+    expect(trendline.rSquared).toBe(1);
+  });
+
+  it('keeps the original index of each point when skipping unparseable scores', () => {
+    const trendline = calculateTrendline([{ score: '10' }, { score: 'absent' }, { score: '30' }]);
+
+    expect(trendline.points).toEqual([{ x: 0, y: 10 }, { x: 2, y: 30 }]);
+    expect(trendline.slope).toBe(10);
+  });
+
+  it('returns null when fewer than two scores parse', () => {
+    expect(calculateTrendline([{ score: 'absent' }, { score: '30' }])).toBeNull();
+  });
+});
+
+describe('selectTopN', () => {
+  const byValueDesc = (a, b) => b.value - a.value;
+
+  it('matches sorting and slicing, keeping ties in input order', () => {
+    const items = [
+      { id: 'a', value: 2 },
+      { id: 'b', value: 5 },
+      { id: 'c', value: 2 },
+      { id: 'd', value: 9 },
+      { id: 'e', value: 5 }
+    ];
+
+    expect(selectTopN(items, 3, byValueDesc)).toEqual([...items].sort(byValueDesc).slice(0, 3));
+    expect(selectTopN(items, 3, byValueDesc).map(i => i.id)).toEqual(['d', 'b', 'e']);
+  });
+
+  it('returns every item when n exceeds the list length', () => {
+    expect(selectTopN([{ value: 1 }, { value: 3 }], 5, byValueDesc)).toEqual([
+      { value: 3 },
+      { value: 1 }
+    ]);
+  });
+
+  it('returns an empty list for a non-positive n', () => {
+    expect(selectTopN([{ value: 1 }], 0, byValueDesc)).toEqual([]);
+  });
+});
+
+describe('groupLogsByGoal', () => {
+  it('buckets logs by goal id in input order', () => {
+    const logsByGoal = groupLogsByGoal(logs);
+
+    expect(logsByGoal.get('g1').map(l => l.id)).toEqual(['l1', 'l3']);
+    expect(logsByGoal.get('missing').map(l => l.id)).toEqual(['l7']);
+    expect(logsByGoal.has('g4')).toBe(false);
+  });
+});
+
+describe('getGoalStatus', () => {
+  const goal = { id: 'g', baseline: '0', target: '100' };
+  const scored = scores => scores.map((score, i) => ({ dateISO: `2024-01-0${i + 1}`, score }));
+
+  it('needs data until three scores parse', () => {
+    expect(getGoalStatus(goal, scored(['50', 'absent', '60']))).toBe('needsData');
+  });
+
+  it('classifies goals by progress toward the target', () => {
+    expect(getGoalStatus(goal, scored(['100', '100', '100']))).toBe('completed');
+    expect(getGoalStatus(goal, scored(['10', '20', '30']))).toBe('offTrack');
+  });
+});
+
+describe('downsampleLTTB', () => {
+  it('returns short series unchanged', () => {
+    const data = [1, 2, 3];
+    expect(downsampleLTTB(data, 5)).toBe(data);
+  });
+
+  it('keeps the endpoints and the requested number of points', () => {
+    const data = Array.from({ length: 100 }, (_, i) => ({ score: Math.sin(i / 5) * 50 + 50 }));
+    const sampled = downsampleLTTB(data, 20, d => d.score);
+
+    expect(sampled).toHaveLength(20);
+    expect(sampled[0]).toBe(data[0]);
+    expect(sampled[19]).toBe(data[99]);
+  });
+
+  it('keeps a spike that a uniform stride would drop', () => {
+    const data = Array.from({ length: 50 }, (_, i) => (i === 23 ? 100 : 0));
+    expect(downsampleLTTB(data, 10)).toContain(100);
+  });
+});
+
+describe('generateTimeSeriesData', () => {
+  const daysAgo = days => new Date(Date.now() - days * 24 * 60 * 60 * 1000).toISOString().slice(0, 10);
+
+  it('aggregates every valid score logged on a date', () => {
+    const date = daysAgo(2);
+    const series = generateTimeSeriesData([
+      { dateISO: date, score: '70' },
+      { dateISO: date, score: '40' },
+      { dateISO: date, score: 'absent' },
+      { dateISO: date, score: '100' }
+    ]);
+
+    expect(series).toEqual([{ date, avgScore: 70, minScore: 40, maxScore: 100, count: 3 }]);
+  });
+
+  it('keeps a date whose logs are all unparseable, with no scores', () => {
+    const empty = daysAgo(3);
+    const scored = daysAgo(1);
+    const series = generateTimeSeriesData([
+      { dateISO: scored, score: '50' },
+      { dateISO: empty, score: 'absent' },
+      { dateISO: empty, score: '' }
+    ]);
+
+    expect(series.map(point => point.date)).toEqual([empty, scored]);
+    expect(series[0]).toEqual({ date: empty, avgScore: 0, minScore: Infinity, maxScore: -Infinity, count: 0 });
+  });
+});
+
+describe('calculateGoalStatusDistribution', () => {
+  it('counts the same goals whether or not they are grouped up front', () => {
+    const goalsByStatus = groupGoalsByStatus(goals, groupLogsByGoal(logs));
+    const distribution = calculateGoalStatusDistribution(goals, undefined, goalsByStatus);
+
+    expect(distribution).toEqual(calculateGoalStatusDistribution(goals, logs));
+    expect(distribution.find(d => d.key === 'needsData').count).toBe(4);
+    expect(goalsByStatus.needsData.map(g => g.id)).toEqual(['g1', 'g2', 'g3', 'g4']);
+  });
+});
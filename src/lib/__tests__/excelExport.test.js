@@ -169,6 +169,14 @@ describe('Excel Export System', () => {
       expect(data.length).toBeLessThanOrEqual(5);
     });
 
+    it('should not reorder the caller\'s array when including inactive students', () => {
+      const unsorted = [mockStudents[1], mockStudents[0]];
+
+      exportStudentRoster(unsorted, { includeInactive: true });
+
+      expect(unsorted.map(s => s.id)).toEqual(['2', '1']);
+    });
+
     it('should respect column selection', () => {
       const workbook = exportStudentRoster(mockStudents, {
         selectedColumns: ['first_name', 'last_name', 'grade_level']
@@ -200,6 +208,26 @@ describe('Excel Export System', () => {
 
       expect(workbook.SheetNames[0]).toContain('Doe');
     });
+
+    it('should apply conditional fills to status and progress cells', () => {
+      const workbook = exportGoalProgressReport(
+        mockStudents,
+        mockGoals,
+        mockProgressLogs,
+        { studentId: '1' }
+      );
+      const worksheet = workbook.Sheets[workbook.SheetNames[0]];
+
+      // First data row is row 5: status in column E, progress % in column H
+      const statusCell = worksheet['E5'];
+      expect(statusCell.s.fill.fgColor.rgb).toBe('4CAF50');
+      expect(statusCell.s.font.bold).toBe(true);
+
+      // 85 WPM against a 60 -> 120 range is under 50% progress
+      const progressCell = worksheet['H5'];
+      expect(progressCell.s.fill.fgColor.rgb).toBe('F44336');
+      expect(progressCell.s.font.bold).toBeUndefined();
+    });
   });
 
   describe('exportProgressLogHistory', () => {
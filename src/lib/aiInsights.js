@@ -38,11 +38,22 @@ function calculateCorrelation(x, y) {
   if (x.length !== y.length || x.length < 2) return 0;
 
   const n = x.length;
-  const sumX = x.reduce((a, b) => a + b, 0);
-  const sumY = y.reduce((a, b) => a + b, 0);
-  const sumXY = x.reduce((sum, xi, i) => sum + xi * y[i], 0);
-  const sumX2 = x.reduce((sum, xi) => sum + xi * xi, 0);
-  const sumY2 = y.reduce((sum, yi) => sum + yi * yi, 0);
+  let sumX = 0;
+  let sumY = 0;
+  let sumXY = 0;
+  let sumX2 = 0;
+  let sumY2 = 0;
+
+  // Accumulate all five sums in one pass
+  for (let i = 0; i < n; i++) {
+    const xi = x[i];
+    const yi = y[i];
+    sumX += xi;
+    sumY += yi;
+    sumXY += xi * yi;
+    sumX2 += xi * xi;
+    sumY2 += yi * yi;
+  }
 
   const numerator = n * sumXY - sumX * sumY;
   const denominator = Math.sqrt((n * sumX2 - sumX * sumX) * (n * sumY2 - sumY * sumY));
@@ -703,10 +714,17 @@ export function generateInsightsSummary(insights) {
     return "No insights available yet. Add more progress data to receive AI-powered analysis.";
   }
 
-  const highPriority = insights.filter(i => i.priority === 'high').length;
-  const atRisk = insights.filter(i => i.type === 'risk').length;
-  const successes = insights.filter(i => i.type === 'success').length;
-  const patterns = insights.filter(i => i.type === 'pattern').length;
+  // Count every category in one pass
+  let highPriority = 0;
+  let atRisk = 0;
+  let successes = 0;
+  let patterns = 0;
+  insights.forEach(insight => {
+    if (insight.priority === 'high') highPriority++;
+    if (insight.type === 'risk') atRisk++;
+    else if (insight.type === 'success') successes++;
+    else if (insight.type === 'pattern') patterns++;
+  });
 
   let summary = `Analysis complete: ${insights.length} insights generated. `;
 
@@ -729,26 +747,46 @@ export function generateInsightsSummary(insights) {
   return summary.trim();
 }
 
+// Insight type -> key in getInsightStats().byType
+const INSIGHT_STAT_KEYS = new Map([
+  ['risk', 'risk'],
+  ['prediction', 'prediction'],
+  ['success', 'success'],
+  ['anomaly', 'anomaly'],
+  ['accommodation', 'accommodation'],
+  ['gap', 'gap'],
+  ['baseline', 'baseline'],
+  ['pattern', 'pattern'],
+  ['iep-review', 'iepReview']
+]);
+
 /**
  * Get insight statistics for dashboard
+ * Tallies priorities and types into fixed buckets in a single pass
  */
 export function getInsightStats(insights) {
+  const priorities = { high: 0, medium: 0, low: 0 };
+  const byType = {};
+  INSIGHT_STAT_KEYS.forEach(key => {
+    byType[key] = 0;
+  });
+  let actionable = 0;
+
+  insights.forEach(i => {
+    if (i.priority === 'high' || i.priority === 'medium' || i.priority === 'low') {
+      priorities[i.priority]++;
+    }
+    const typeKey = INSIGHT_STAT_KEYS.get(i.type);
+    if (typeKey) byType[typeKey]++;
+    if (i.actionable) actionable++;
+  });
+
   return {
     total: insights.length,
-    highPriority: insights.filter(i => i.priority === 'high').length,
-    mediumPriority: insights.filter(i => i.priority === 'medium').length,
-    lowPriority: insights.filter(i => i.priority === 'low').length,
-    actionable: insights.filter(i => i.actionable).length,
-    byType: {
-      risk: insights.filter(i => i.type === 'risk').length,
-      prediction: insights.filter(i => i.type === 'prediction').length,
-      success: insights.filter(i => i.type === 'success').length,
-      anomaly: insights.filter(i => i.type === 'anomaly').length,
-      accommodation: insights.filter(i => i.type === 'accommodation').length,
-      gap: insights.filter(i => i.type === 'gap').length,
-      baseline: insights.filter(i => i.type === 'baseline').length,
-      pattern: insights.filter(i => i.type === 'pattern').length,
-      iepReview: insights.filter(i => i.type === 'iep-review').length
-    }
+    highPriority: priorities.high,
+    mediumPriority: priorities.medium,
+    lowPriority: priorities.low,
+    actionable,
+    byType
   };
 }
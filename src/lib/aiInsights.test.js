@@ -373,6 +373,24 @@ describe('AI Insights Engine', () => {
       expect(summary).toContain('insights generated');
     });
 
+    it('should count each summary category', () => {
+      const insights = [
+        { type: 'risk', priority: 'high' },
+        { type: 'risk', priority: 'medium' },
+        { type: 'success', priority: 'low' },
+        { type: 'pattern', priority: 'low' },
+        { type: 'gap', priority: 'high' }
+      ];
+
+      const summary = generateInsightsSummary(insights);
+
+      expect(summary).toContain('5 insights generated');
+      expect(summary).toContain('2 high-priority items');
+      expect(summary).toContain('2 student(s) identified as at-risk');
+      expect(summary).toContain('1 goal(s) achieved');
+      expect(summary).toContain('1 success pattern(s)');
+    });
+
     it('should calculate insight statistics', () => {
       const logs = [
         { id: 'l1', goalId: 'g1', dateISO: daysAgo(20), score: '60', notes: '' },
@@ -401,6 +419,31 @@ describe('AI Insights Engine', () => {
       expect(summary).toContain('No insights available');
       expect(stats.total).toBe(0);
     });
+
+    it('should tally priorities and types', () => {
+      const stats = getInsightStats([
+        { type: 'risk', priority: 'high', actionable: true },
+        { type: 'iep-review', priority: 'high', actionable: true },
+        { type: 'success', priority: 'low', actionable: false },
+        { type: 'unknown', priority: 'medium', actionable: false }
+      ]);
+
+      expect(stats.highPriority).toBe(2);
+      expect(stats.mediumPriority).toBe(1);
+      expect(stats.lowPriority).toBe(1);
+      expect(stats.actionable).toBe(2);
+      expect(stats.byType).toEqual({
+        risk: 1,
+        prediction: 0,
+        success: 1,
+        anomaly: 0,
+        accommodation: 0,
+        gap: 0,
+        baseline: 0,
+        pattern: 0,
+        iepReview: 1
+      });
+    });
   });
 
   describe('Confidence Scores', () => {
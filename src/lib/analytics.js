@@ -5,6 +5,35 @@
 
 import { parseScore } from './data';
 
+// Shared chart date formatters; toLocaleDateString() creates a new Intl formatter per call
+const chartDateFormatter = new Intl.DateTimeFormat('en-US', { month: 'short', day: 'numeric' });
+const chartDateLongFormatter = new Intl.DateTimeFormat('en-US', {
+  weekday: 'long',
+  year: 'numeric',
+  month: 'long',
+  day: 'numeric'
+});
+
+// Intl format() throws on invalid dates; match toLocaleDateString() instead
+function formatWith(formatter, date) {
+  const value = new Date(date);
+  return isNaN(value.getTime()) ? 'Invalid Date' : formatter.format(value);
+}
+
+/**
+ * Format a date for chart axes (e.g., "Jan 5")
+ */
+export function formatChartDate(date) {
+  return formatWith(chartDateFormatter, date);
+}
+
+/**
+ * Format a date for chart tooltips (e.g., "Friday, January 5, 2024")
+ */
+export function formatChartDateLong(date) {
+  return formatWith(chartDateLongFormatter, date);
+}
+
 /**
  * Calculate mean (average) of an array of numbers
  */
@@ -41,10 +70,17 @@ export function calculateStdDev(values) {
   const validValues = values.filter(v => typeof v === 'number' && !isNaN(v));
   if (validValues.length < 2) return 0;
 
-  const mean = calculateMean(validValues);
-  const squaredDiffs = validValues.map(val => Math.pow(val - mean, 2));
-  const variance = squaredDiffs.reduce((sum, val) => sum + val, 0) / validValues.length;
-  return Math.sqrt(variance);
+  // Mean and squared deviations over the validated values
+  let sum = 0;
+  for (const val of validValues) sum += val;
+  const mean = sum / validValues.length;
+
+  let squaredDiffSum = 0;
+  for (const val of validValues) {
+    const diff = val - mean;
+    squaredDiffSum += diff * diff;
+  }
+  return Math.sqrt(squaredDiffSum / validValues.length);
 }
 
 /**
@@ -67,47 +103,117 @@ export function calculatePercentile(values, percentile) {
   return validValues[lower] * (1 - weight) + validValues[upper] * weight;
 }
 
+/**
+ * Select the first n items a stable sort by compare would produce
+ * Keeps a sorted buffer of at most n items: O(N log n) comparisons
+ */
+export function selectTopN(items, n, compare) {
+  const top = [];
+  if (!items || n <= 0) return top;
+
+  for (const item of items) {
+    if (top.length === n && compare(item, top[n - 1]) >= 0) continue;
+
+    // Insert after any equal items so ties keep their input order, like Array.prototype.sort
+    let low = 0;
+    let high = top.length;
+    while (low < high) {
+      const mid = (low + high) >> 1;
+      if (compare(item, top[mid]) < 0) high = mid;
+      else low = mid + 1;
+    }
+    top.splice(low, 0, item);
+    if (top.length > n) top.pop();
+  }
+
+  return top;
+}
+
 /**
  * Calculate linear regression trendline
  */
 export function calculateTrendline(data) {
   if (!data || data.length < 2) return null;
 
-  const points = data
-    .map((d, i) => ({ x: i, y: typeof d === 'number' ? d : parseScore(d.score) }))
-    .filter(p => p.y !== null);
+  // Collect points and accumulate the regression sums in a single pass
+  const points = [];
+  let sumX = 0;
+  let sumY = 0;
+  let sumXY = 0;
+  let sumX2 = 0;
+
+  for (let i = 0; i < data.length; i++) {
+    const d = data[i];
+    const y = typeof d === 'number' ? d : parseScore(d.score);
+    if (y === null) continue;
+
+    points.push({ x: i, y });
+    sumX += i;
+    sumY += y;
+    sumXY += i * y;
+    sumX2 += i * i;
+  }
 
   if (points.length < 2) return null;
 
   const n = points.length;
-  const sumX = points.reduce((sum, p) => sum + p.x, 0);
-  const sumY = points.reduce((sum, p) => sum + p.y, 0);
-  const sumXY = points.reduce((sum, p) => sum + p.x * p.y, 0);
-  const sumX2 = points.reduce((sum, p) => sum + p.x * p.x, 0);
-
   const denominator = n * sumX2 - sumX * sumX;
   if (denominator === 0) return null;
 
   const slope = (n * sumXY - sumX * sumY) / denominator;
   const intercept = (sumY - slope * sumX) / n;
 
-  // Calculate R-squared for trend strength
+  // Calculate R-squared for trend strength (total and residual sums in one pass)
   const meanY = sumY / n;
-  const ssTotal = points.reduce((sum, p) => sum + Math.pow(p.y - meanY, 2), 0);
-  const ssResidual = points.reduce((sum, p) => {
-    const predicted = slope * p.x + intercept;
-    return sum + Math.pow(p.y - predicted, 2);
-  }, 0);
+  let ssTotal = 0;
+  let ssResidual = 0;
+  for (let i = 0; i < n; i++) {
+    const { x, y } = points[i];
+    const deviation = y - meanY;
+    const residual = y - (slope * x + intercept);
+    ssTotal += deviation * deviation;
+    ssResidual += residual * residual;
+  }
   const rSquared = 1 - (ssResidual / ssTotal);
 
   return { slope, intercept, rSquared, points };
 }
 
+/**
+ * Least-squares slope of a plain numeric series, indexed 0..n-1
+ * Computes the slope only: no points, intercept or R-squared
+ */
+function fitSlope(values) {
+  const n = values.length;
+  if (n < 2) return null;
+
+  let sumX = 0;
+  let sumY = 0;
+  let sumXY = 0;
+  let sumX2 = 0;
+  for (let i = 0; i < n; i++) {
+    sumX += i;
+    sumY += values[i];
+    sumXY += i * values[i];
+    sumX2 += i * i;
+  }
+
+  const denominator = n * sumX2 - sumX * sumX;
+  if (denominator === 0) return null;
+  return (n * sumXY - sumX * sumY) / denominator;
+}
+
+function classifyTrendDirection(slope) {
+  if (slope > 0.1) return 'improving';
+  if (slope < -0.1) return 'declining';
+  return 'stable';
+}
+
 /**
  * Predict future values based on trendline
+ * Accepts a precomputed trendline so callers that already fit one don't refit it
  */
-export function predictFutureValues(data, periods = 3) {
-  const trendline = calculateTrendline(data);
+export function predictFutureValues(data, periods = 3, trendline = calculateTrendline(data)) {
   if (!trendline) return [];
 
   const predictions = [];
@@ -128,9 +234,9 @@ export function predictFutureValues(data, periods = 3) {
 
 /**
  * Analyze trend direction and strength
+ * Accepts a precomputed trendline so callers that already fit one don't refit it
  */
-export function analyzeTrend(data) {
-  const trendline = calculateTrendline(data);
+export function analyzeTrend(data, trendline = calculateTrendline(data)) {
   if (!trendline) {
     return { direction: 'stable', strength: 'none', slope: 0, confidence: 0 };
   }
@@ -140,12 +246,8 @@ export function analyzeTrend(data) {
   if (absSlope > 2) strength = 'strong';
   else if (absSlope > 0.5) strength = 'moderate';
 
-  let direction = 'stable';
-  if (trendline.slope > 0.1) direction = 'improving';
-  else if (trendline.slope < -0.1) direction = 'declining';
-
   return {
-    direction,
+    direction: classifyTrendDirection(trendline.slope),
     strength,
     slope: trendline.slope,
     confidence: trendline.rSquared * 100
@@ -168,20 +270,22 @@ export function calculatePerformanceScore(logs, baseline, target) {
 
   const latestScore = scores[scores.length - 1];
   const progressPercent = ((latestScore - baselineNum) / (targetNum - baselineNum)) * 100;
-  const trend = analyzeTrend(scores);
+  // Only the trend direction is used, so fit the slope alone
+  const slope = fitSlope(scores);
+  const direction = slope === null ? 'stable' : classifyTrendDirection(slope);
   const consistency = 100 - (calculateStdDev(scores) / calculateMean(scores)) * 100;
 
   // Weighted performance score
   const performanceScore = (
     progressPercent * 0.5 +
-    (trend.direction === 'improving' ? 30 : trend.direction === 'declining' ? -10 : 10) +
+    (direction === 'improving' ? 30 : direction === 'declining' ? -10 : 10) +
     consistency * 0.2
   );
 
   return {
     score: Math.max(0, Math.min(100, performanceScore)),
     progress: progressPercent,
-    trend: trend.direction,
+    trend: direction,
     consistency: Math.max(0, Math.min(100, consistency)),
     dataPoints: scores.length
   };
@@ -276,6 +380,57 @@ export function calculateMovingAverage(data, windowSize = 3) {
   return movingAverages;
 }
 
+// Past this many points, per-point SVG dots and line animations dominate chart render time
+export const DENSE_CHART_POINTS = 150;
+
+/**
+ * Downsample a series with Largest-Triangle-Three-Buckets, keeping its visual shape
+ * Returns the input untouched when it already fits in maxPoints; x is the item index
+ */
+export function downsampleLTTB(data, maxPoints, getValue = d => d) {
+  if (!data || maxPoints < 3 || data.length <= maxPoints) return data;
+
+  const sampled = [data[0]];
+  const bucketSize = (data.length - 2) / (maxPoints - 2);
+  let anchor = 0;
+
+  for (let i = 0; i < maxPoints - 2; i++) {
+    // Average of the next bucket is the third corner of the triangle
+    const nextStart = Math.floor((i + 1) * bucketSize) + 1;
+    const nextEnd = Math.min(Math.floor((i + 2) * bucketSize) + 1, data.length);
+    let avgX = 0;
+    let avgY = 0;
+    for (let j = nextStart; j < nextEnd; j++) {
+      avgX += j;
+      avgY += getValue(data[j]);
+    }
+    avgX /= nextEnd - nextStart;
+    avgY /= nextEnd - nextStart;
+
+    // Keep the point in this bucket forming the largest triangle with the anchor and that average
+    const start = Math.floor(i * bucketSize) + 1;
+    const end = Math.floor((i + 1) * bucketSize) + 1;
+    const anchorY = getValue(data[anchor]);
+    let maxArea = -1;
+    let selected = start;
+    for (let j = start; j < end; j++) {
+      const area = Math.abs(
+        (anchor - avgX) * (getValue(data[j]) - anchorY) - (anchor - j) * (avgY - anchorY)
+      );
+      if (area > maxArea) {
+        maxArea = area;
+        selected = j;
+      }
+    }
+
+    sampled.push(data[selected]);
+    anchor = selected;
+  }
+
+  sampled.push(data[data.length - 1]);
+  return sampled;
+}
+
 /**
  * Detect anomalies in progress data
  */
@@ -433,40 +588,66 @@ export function calculateGoalAreaDistribution(goals) {
 }
 
 /**
- * Calculate goal status distribution
+ * Group logs by goal id in a single pass
  */
-export function calculateGoalStatusDistribution(goals, logs) {
-  const distribution = {
-    onTrack: { status: 'On Track', count: 0, percentage: 0, color: '#65A39B' },
-    offTrack: { status: 'Off Track', count: 0, percentage: 0, color: '#E3866B' },
-    needsData: { status: 'Needs Data', count: 0, percentage: 0, color: '#9CA3AF' },
-    completed: { status: 'Completed', count: 0, percentage: 0, color: '#10B981' }
-  };
+export function groupLogsByGoal(logs) {
+  const logsByGoal = new Map();
+  logs.forEach(log => {
+    if (!logsByGoal.has(log.goalId)) {
+      logsByGoal.set(log.goalId, []);
+    }
+    logsByGoal.get(log.goalId).push(log);
+  });
+  return logsByGoal;
+}
 
-  goals.forEach(goal => {
-    const goalLogs = logs.filter(l => l.goalId === goal.id);
-    const scores = goalLogs.map(log => parseScore(log.score)).filter(s => s !== null);
+/**
+ * Classify a goal as completed, onTrack, offTrack or needsData from its logs
+ */
+export function getGoalStatus(goal, goalLogs) {
+  let scoredCount = 0;
+  for (const log of goalLogs) {
+    if (parseScore(log.score) !== null) scoredCount++;
+  }
+  if (scoredCount < 3) return 'needsData';
 
-    if (scores.length < 3) {
-      distribution.needsData.count++;
-    } else {
-      const performance = calculatePerformanceScore(goalLogs, goal.baseline, goal.target);
-      if (performance) {
-        if (performance.progress >= 100) {
-          distribution.completed.count++;
-        } else if (performance.progress >= 80) {
-          distribution.onTrack.count++;
-        } else {
-          distribution.offTrack.count++;
-        }
-      } else {
-        distribution.needsData.count++;
-      }
-    }
+  const performance = calculatePerformanceScore(goalLogs, goal.baseline, goal.target);
+  if (!performance) return 'needsData';
+  if (performance.progress >= 100) return 'completed';
+  if (performance.progress >= 80) return 'onTrack';
+  return 'offTrack';
+}
+
+/**
+ * Group goals by status key (see getGoalStatus)
+ */
+export function groupGoalsByStatus(goals, logsByGoal) {
+  const grouped = { onTrack: [], offTrack: [], needsData: [], completed: [] };
+  goals.forEach(goal => {
+    grouped[getGoalStatus(goal, logsByGoal.get(goal.id) || [])].push(goal);
   });
+  return grouped;
+}
+
+/**
+ * Calculate goal status distribution
+ * Counts come from goalsByStatus (see groupGoalsByStatus), built from logs when not given
+ */
+export function calculateGoalStatusDistribution(
+  goals,
+  logs,
+  goalsByStatus = groupGoalsByStatus(goals, groupLogsByGoal(logs))
+) {
+  const distribution = {
+    onTrack: { key: 'onTrack', status: 'On Track', count: 0, percentage: 0, color: '#65A39B' },
+    offTrack: { key: 'offTrack', status: 'Off Track', count: 0, percentage: 0, color: '#E3866B' },
+    needsData: { key: 'needsData', status: 'Needs Data', count: 0, percentage: 0, color: '#9CA3AF' },
+    completed: { key: 'completed', status: 'Completed', count: 0, percentage: 0, color: '#10B981' }
+  };
 
   const total = goals.length;
   Object.values(distribution).forEach(item => {
+    item.count = goalsByStatus[item.key].length;
     item.percentage = total > 0 ? Math.round((item.count / total) * 100) : 0;
   });
 
@@ -480,7 +661,7 @@ export function generateTimeSeriesData(logs, timeRange = 30) {
   const now = new Date();
   const startDate = new Date(now.getTime() - timeRange * 24 * 60 * 60 * 1000);
 
-  // Group logs by date
+  // Group logs by date with running sum, count, min and max of the valid scores
   const dateGroups = {};
 
   logs.forEach(log => {
@@ -488,11 +669,15 @@ export function generateTimeSeriesData(logs, timeRange = 30) {
     if (logDate >= startDate) {
       const dateKey = logDate.toISOString().split('T')[0];
       if (!dateGroups[dateKey]) {
-        dateGroups[dateKey] = [];
+        dateGroups[dateKey] = { sum: 0, count: 0, min: Infinity, max: -Infinity };
       }
       const score = parseScore(log.score);
       if (score !== null) {
-        dateGroups[dateKey].push(score);
+        const group = dateGroups[dateKey];
+        group.sum += score;
+        group.count++;
+        if (score < group.min) group.min = score;
+        if (score > group.max) group.max = score;
       }
     }
   });
@@ -502,13 +687,13 @@ export function generateTimeSeriesData(logs, timeRange = 30) {
   const sortedDates = Object.keys(dateGroups).sort();
 
   sortedDates.forEach(date => {
-    const scores = dateGroups[date];
+    const group = dateGroups[date];
     timeSeriesData.push({
       date,
-      avgScore: calculateMean(scores),
-      minScore: Math.min(...scores),
-      maxScore: Math.max(...scores),
-      count: scores.length
+      avgScore: group.count > 0 ? group.sum / group.count : 0,
+      minScore: group.min,
+      maxScore: group.max,
+      count: group.count
     });
   });
 
@@ -519,24 +704,50 @@ export function generateTimeSeriesData(logs, timeRange = 30) {
  * Calculate student comparison metrics
  */
 export function calculateStudentComparisons(students, goals, logs) {
-  return students.map(student => {
-    const studentGoals = goals.filter(g => g.studentId === student.id);
-    const studentLogs = logs.filter(log =>
-      studentGoals.some(g => g.id === log.goalId)
-    );
+  // Index goals by id and by student, then bucket valid scores by student and by student+area
+  const goalsById = new Map();
+  const goalsByStudent = new Map();
+  goals.forEach(goal => {
+    goalsById.set(goal.id, goal);
+    if (!goalsByStudent.has(goal.studentId)) {
+      goalsByStudent.set(goal.studentId, []);
+    }
+    goalsByStudent.get(goal.studentId).push(goal);
+  });
+
+  const scoresByStudent = new Map();
+  const areaScoresByStudent = new Map();
+  logs.forEach(log => {
+    const goal = goalsById.get(log.goalId);
+    if (!goal) return;
 
-    const scores = studentLogs.map(log => parseScore(log.score)).filter(s => s !== null);
+    const score = parseScore(log.score);
+    if (score === null) return;
 
-    let skillBreakdown = {};
+    if (!scoresByStudent.has(goal.studentId)) {
+      scoresByStudent.set(goal.studentId, []);
+      areaScoresByStudent.set(goal.studentId, {});
+    }
+    scoresByStudent.get(goal.studentId).push(score);
+
+    const area = goal.area || 'General';
+    const areaScores = areaScoresByStudent.get(goal.studentId);
+    if (!areaScores[area]) {
+      areaScores[area] = [];
+    }
+    areaScores[area].push(score);
+  });
+
+  return students.map(student => {
+    const studentGoals = goalsByStudent.get(student.id) || [];
+    const scores = scoresByStudent.get(student.id) || [];
+    const areaScores = areaScoresByStudent.get(student.id) || {};
+
+    // Preserve goal order for skill areas, including areas with no scores yet
+    const skillBreakdown = {};
     studentGoals.forEach(goal => {
       const area = goal.area || 'General';
-      const goalLogs = logs.filter(l => l.goalId === goal.id);
-      const areaScores = goalLogs.map(log => parseScore(log.score)).filter(s => s !== null);
-
-      if (!skillBreakdown[area]) {
-        skillBreakdown[area] = [];
-      }
-      skillBreakdown[area].push(...areaScores);
+      skillBreakdown[area] = areaScores[area] || [];
     });
 
     const skillAverages = {};
@@ -182,8 +182,13 @@ export function exportJSON(store) {
 
 export function exportCSV(rows, filename) {
   if (typeof document === "undefined") return;
-  const csv = rows.map(r => r.map(s => `"${String(s ?? "").replaceAll('"', '""')}"`).join(",")).join("\n");
-  const blob = new Blob([csv], { type: "text/csv" });
+  // One Blob part per row (and per separator)
+  const parts = [];
+  rows.forEach((r, i) => {
+    if (i > 0) parts.push("\n");
+    parts.push(r.map(s => `"${String(s ?? "").replaceAll('"', '""')}"`).join(","));
+  });
+  const blob = new Blob(parts, { type: "text/csv" });
   const url = URL.createObjectURL(blob);
   const a = document.createElement("a");
   a.href = url;
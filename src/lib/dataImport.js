@@ -131,8 +131,9 @@ export function parseFile(file) {
 
     reader.onload = (e) => {
       try {
-        const data = e.target.result;
-        const workbook = XLSX.read(data, { type: 'binary', cellDates: true });
+        // Read raw bytes; SheetJS parses typed arrays much faster than binary strings
+        const data = new Uint8Array(e.target.result);
+        const workbook = XLSX.read(data, { type: 'array', cellDates: true });
 
         // Get first sheet
         const sheetName = workbook.SheetNames[0];
@@ -169,7 +170,7 @@ export function parseFile(file) {
       reject(new Error('Failed to read file'));
     };
 
-    reader.readAsBinaryString(file);
+    reader.readAsArrayBuffer(file);
   });
 }
 
@@ -58,6 +58,18 @@ const TITLE_STYLE = {
   alignment: { horizontal: 'center', vertical: 'center' }
 };
 
+// Conditional-format fill lookups. COLORS entries map to shared prebuilt styles, like
+// CELL_STYLE; any other color gets a style built on the spot.
+function fillStyleLookup(font) {
+  const build = color => ({ ...CELL_STYLE, fill: { fgColor: color }, font });
+  const styles = new Map(Object.values(COLORS).map(color => [color, build(color)]));
+  return color => styles.get(color) ?? build(color);
+}
+
+const fillStyle = fillStyleLookup(CELL_STYLE.font);
+const boldFillStyle = fillStyleLookup({ ...CELL_STYLE.font, bold: true });
+const inverseFillStyle = fillStyleLookup({ ...CELL_STYLE.font, color: { rgb: 'FFFFFF' } });
+
 // ============================================================================
 // UTILITY FUNCTIONS
 // ============================================================================
@@ -145,8 +157,7 @@ function applyConditionalFormatting(worksheet, row, col, value, conditions) {
 
   for (const condition of conditions) {
     if (condition.test(value)) {
-      const style = { ...CELL_STYLE, fill: { fgColor: condition.color } };
-      styleCell(worksheet, address, style);
+      styleCell(worksheet, address, fillStyle(condition.color));
       break;
     }
   }
@@ -283,9 +294,9 @@ export function exportStudentRoster(students, options = {}) {
     sortBy = 'lastName'
   } = options;
 
-  // Filter students
+  // Filter students into a new array; the sort below is in place
   let filteredStudents = includeInactive
-    ? students
+    ? [...students]
     : students.filter(s => s.is_active);
 
   // Sort students
@@ -353,8 +364,7 @@ export function exportStudentRoster(students, options = {}) {
       if (columns[col].format === 'status') {
         const value = data[row][col];
         const color = value === 'Active' ? COLORS.success : COLORS.darkGray;
-        const style = { ...CELL_STYLE, fill: { fgColor: color }, font: { ...CELL_STYLE.font, color: { rgb: 'FFFFFF' } } };
-        styleCell(ws, cellAddress, style);
+        styleCell(ws, cellAddress, inverseFillStyle(color));
       }
     }
   }
@@ -466,8 +476,7 @@ export function exportGoalProgressReport(students, goals, progressLogs, options
           else if (value === 'COMPLETED') color = COLORS.secondary;
           else if (value === 'DISCONTINUED') color = COLORS.danger;
 
-          const style = { ...CELL_STYLE, fill: { fgColor: color }, font: { ...CELL_STYLE.font, bold: true } };
-          styleCell(ws, cellAddress, style);
+          styleCell(ws, cellAddress, boldFillStyle(color));
         }
 
         // Conditional formatting for progress %
@@ -480,8 +489,7 @@ export function exportGoalProgressReport(students, goals, progressLogs, options
           else if (progressValue < 50 && progressValue > 0) color = COLORS.danger;
 
           if (progressValue > 0) {
-            const style = { ...CELL_STYLE, fill: { fgColor: color } };
-            styleCell(ws, cellAddress, style);
+            styleCell(ws, cellAddress, fillStyle(color));
           }
         }
 
@@ -494,8 +502,7 @@ export function exportGoalProgressReport(students, goals, progressLogs, options
           else if (value === 'Declining') color = COLORS.danger;
 
           if (value !== 'No Data' && value !== 'Stable') {
-            const style = { ...CELL_STYLE, fill: { fgColor: color }, font: { ...CELL_STYLE.font, bold: true } };
-            styleCell(ws, cellAddress, style);
+            styleCell(ws, cellAddress, boldFillStyle(color));
           }
         }
       }
@@ -642,8 +649,7 @@ export function exportComplianceTracking(students, complianceItems, serviceLogs,
         else if (status === 'PENDING') color = COLORS.warning;
         else if (status === 'OVERDUE') color = COLORS.danger;
 
-        const style = { ...CELL_STYLE, fill: { fgColor: color }, font: { ...CELL_STYLE.font, bold: true } };
-        styleCell(wsCompliance, cellAddress, style);
+        styleCell(wsCompliance, cellAddress, boldFillStyle(color));
       }
 
       // Days until due color coding
@@ -656,8 +662,7 @@ export function exportComplianceTracking(students, complianceItems, serviceLogs,
           else if (days <= 7) color = COLORS.warning;
           else if (days <= 30) color = COLORS.lightGray;
 
-          const style = { ...CELL_STYLE, fill: { fgColor: color } };
-          styleCell(wsCompliance, cellAddress, style);
+          styleCell(wsCompliance, cellAddress, fillStyle(color));
         }
       }
     }
@@ -946,8 +951,7 @@ export function exportAnalyticsSummary(students, goals, progressLogs, options =
         else if (progress > 0) color = COLORS.danger;
 
         if (progress > 0) {
-          const style = { ...CELL_STYLE, fill: { fgColor: color } };
-          styleCell(wsStudents, cellAddress, style);
+          styleCell(wsStudents, cellAddress, fillStyle(color));
         }
       }
     }